@@ -1,17 +1,32 @@
 import sys
 import logging
 import asyncio
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QAxContainer import QAxWidget
 from PyQt5.QtCore import QEventLoop, QTimer
 import uuid
 import time
+import itertools
 from app.utils.logging_utils import setupLogging
 import datetime
 
 logger = setupLogging()
 
+# 키움 OpenAPI dynamicCall 시그니처 (호출마다 문자열을 새로 만들지 않도록 모듈 상수로 보관)
+_SIG_COMM_CONNECT = sys.intern("CommConnect()")
+_SIG_GET_LOGIN = sys.intern("GetLoginInfo(QString)")
+_SIG_SET_INPUT = sys.intern("SetInputValue(QString, QString)")
+_SIG_COMM_RQ = sys.intern("CommRqData(QString, QString, int, QString)")
+_SIG_GET_CHEJAN = sys.intern("GetChejanData(int)")
+_SIG_GET_REPEAT_CNT = sys.intern("GetRepeatCnt(QString, QString)")
+_SIG_GET_COMM_DATA = sys.intern("GetCommData(QString, QString, int, QString)")
+_SIG_GET_MARKET = sys.intern("GetCodeListByMarket(QString)")
+_SIG_GET_NAME = sys.intern("GetMasterCodeName(QString)")
+
+# TR 요청용 화면번호 풀 (주문 화면 01xx와 겹치지 않게 2000번대 사용, 키움 화면 200개 제한 이내)
+_TR_SCREEN_NUMBERS = tuple(f"{i:04d}" for i in range(2000, 2100))
+
 class OrderManager:
     """주문 관리자 - 비동기 주문 처리"""
     
@@ -50,7 +65,7 @@ class OrderManager:
             result = await order_request["future"]
             return result
         except Exception as e:
-            logger.error(f"주문 처리 오류: {e}")
+            logger.error("주문 처리 오류: %s", e)
             return {"error": str(e), "order_id": order_id}
     
     def complete_order(self, order_id: str, result: Dict[str, Any]) -> None:
@@ -73,12 +88,30 @@ class OrderManager:
             if not order_request["future"].done():
                 order_request["future"].set_result({"error": error, "order_id": order_id})
 
+class PendingRequest:
+    """대기 중인 TR 요청 정보"""
+    
+    __slots__ = ("tr_code", "inputs", "callback", "timestamp", "completed", "result")
+    
+    def __init__(self, tr_code: str, inputs: Dict[str, str], callback: Optional[Callable] = None):
+        self.tr_code = tr_code
+        self.inputs = inputs
+        self.callback = callback
+        self.timestamp = time.time()
+        self.completed = False
+        self.result: Any = None
+
 class TrRequestManager:
     """TR 요청 관리자"""
     
     def __init__(self):
-        self._pending_requests: Dict[str, Dict[str, Any]] = {}
+        self._pending_requests: Dict[str, PendingRequest] = {}
+        self._next_id = 0
         self._tr_configs: Dict[str, Dict[str, Any]] = self._init_tr_configs()
+        
+        # TR별 출력 필드명 튜플 사전 계산 (수신 시마다 outputs를 다시 순회하지 않음)
+        for config in self._tr_configs.values():
+            config["_field_tuple"] = tuple(sys.intern(field_name) for field_name in config["outputs"])
     
     def _init_tr_configs(self) -> Dict[str, Dict[str, Any]]:
         """TR 설정 초기화 - 키움 공식 문서 기준"""
@@ -156,33 +189,36 @@ class TrRequestManager:
     def create_request(self, tr_code: str, inputs: Dict[str, str], 
                      callback: Optional[Callable] = None) -> str:
         """TR 요청 생성"""
-        request_id = f"{tr_code}_{uuid.uuid4().hex[:8]}"
+        # 요청 ID는 단조 증가 정수로 발급 (uuid 생성 비용 제거)
+        self._next_id += 1
+        request_id = f"{tr_code}_{self._next_id:08x}"
         
-        self._pending_requests[request_id] = {
-            "tr_code": tr_code,
-            "inputs": inputs,
-            "callback": callback,
-            "timestamp": time.time(),
-            "completed": False,
-            "result": None
-        }
+        self._pending_requests[request_id] = PendingRequest(tr_code, inputs, callback)
         
         return request_id
     
     def complete_request(self, request_id: str, result: Dict[str, Any]) -> None:
         """요청 완료 처리"""
-        if request_id in self._pending_requests:
-            request = self._pending_requests[request_id]
-            request["completed"] = True
-            request["result"] = result
+        request = self._pending_requests.get(request_id)
+        if request:
+            request.completed = True
+            request.result = result
             
-            if request["callback"]:
-                request["callback"](result)
+            if request.callback:
+                request.callback(result)
+    
+    def has_config(self, tr_code: str) -> bool:
+        """출력 필드 설정이 있는 TR인지 확인 (설정이 없으면 데이터를 추출하지 않음)"""
+        return bool(self._tr_configs.get(tr_code, {}).get("_field_tuple"))
     
-    def get_request(self, request_id: str) -> Optional[Dict[str, Any]]:
+    def get_request(self, request_id: str) -> Optional[PendingRequest]:
         """요청 정보 조회"""
         return self._pending_requests.get(request_id)
     
+    def pop_request(self, request_id: str) -> Optional[PendingRequest]:
+        """요청 정보 조회 후 제거 (완료/실패/타임아웃 요청이 쌓이지 않도록)"""
+        return self._pending_requests.pop(request_id, None)
+    
     def parse_data(self, tr_code: str, raw_data: Dict[str, str]) -> Dict[str, Any]:
         """TR 데이터 파싱 - 키움 데이터 형식 정확히 처리"""
         config = self._tr_configs.get(tr_code, {})
@@ -247,9 +283,19 @@ class KiwoomComponent(QAxWidget):
                 self._order_manager = OrderManager()
                 self._current_request_id: Optional[str] = None
                 self._request_event_loop: Optional[QEventLoop] = None
-                self._timeout_timer: Optional[QTimer] = None
+                # TR 요청 타임아웃 타이머 (요청마다 생성하지 않고 재사용)
+                self._timeout_timer = QTimer()
+                self._timeout_timer.setSingleShot(True)
+                self._timeout_timer.timeout.connect(self._on_request_timeout)
                 self._user_info: Dict[str, str] = {}
                 self._order_results: Dict[str, Dict[str, Any]] = {}
+                self._code_set: frozenset = frozenset()
+                self._name_to_code: Dict[str, str] = {}
+                # TR 화면번호 순환 풀 및 사용 중인 화면번호
+                self._screen_pool = itertools.cycle(_TR_SCREEN_NUMBERS)
+                self._active_screens: set = set()
+                # 시장별 종목코드 캐시 ((시장구분, 날짜) -> 종목코드 튜플)
+                self._market_codes: Dict[Tuple[str, datetime.date], Tuple[str, ...]] = {}
                 
                 # 주문 처리 워커 시작
                 asyncio.create_task(self._order_processor())
@@ -257,7 +303,7 @@ class KiwoomComponent(QAxWidget):
                 KiwoomComponent._initialized = True
                 self._logger.info("키움 API 컨트롤 초기화 성공")
             except Exception as e:
-                self._logger.error(f"키움 API 컨트롤 초기화 실패: {e}")
+                self._logger.error("키움 API 컨트롤 초기화 실패: %s", e)
                 raise
 
     async def _order_processor(self) -> None:
@@ -286,7 +332,7 @@ class KiwoomComponent(QAxWidget):
                         self._order_manager._current_orders -= 1
                 
             except Exception as e:
-                self._logger.error(f"주문 처리 워커 오류: {e}")
+                self._logger.error("주문 처리 워커 오류: %s", e)
                 await asyncio.sleep(1)
 
     async def _execute_order(self, order_request: Dict[str, Any]) -> Dict[str, Any]:
@@ -308,14 +354,14 @@ class KiwoomComponent(QAxWidget):
             )
             
             if ret == 0:
-                self._logger.info(f"주문 전송 성공: {order_data['code']}, {order_data['qty']}주")
+                self._logger.info("주문 전송 성공: %s, %s주", order_data['code'], order_data['qty'])
                 
-                # 주문 결과 대기 (최대 10초)
+                # 주문 결과 대기 (최대 10초, 시스템 시각 변경에 영향받지 않는 monotonic 기준)
                 order_id = order_request["order_id"]
                 timeout = 10
-                start_time = time.time()
+                deadline = time.monotonic() + timeout
                 
-                while time.time() - start_time < timeout:
+                while time.monotonic() < deadline:
                     if order_id in self._order_results:
                         result = self._order_results[order_id]
                         del self._order_results[order_id]  # 메모리 정리
@@ -357,35 +403,39 @@ class KiwoomComponent(QAxWidget):
                 return True
 
             self._login_event_loop = QEventLoop()
-            ret = self.dynamicCall("CommConnect()")
-            self._logger.info(f"CommConnect() 결과: {ret}")
+            ret = self.dynamicCall(_SIG_COMM_CONNECT)
+            self._logger.info("CommConnect() 결과: %s", ret)
             
             if ret == 0:
                 self._logger.info("로그인 창 대기 중...")
                 self._login_event_loop.exec_()
                 return self._is_connected
             else:
-                self._logger.error(f"로그인 요청 실패: {ret}")
+                self._logger.error("로그인 요청 실패: %s", ret)
                 return False
                 
         except Exception as e:
-            self._logger.error(f"로그인 호출 오류: {e}")
+            self._logger.error("로그인 호출 오류: %s", e)
             return False
 
     def _event_connect(self, err_code: int) -> None:
         """로그인 결과 이벤트 처리"""
-        self._logger.info(f"로그인 결과: {err_code}")
+        self._logger.info("로그인 결과: %s", err_code)
         
         try:
             if err_code == 0:
                 self._is_connected = True
                 self._logger.info("로그인 성공!")
+                # 재접속 시 종목코드 맵 초기화 (다음 조회 시 다시 구성)
+                self._code_set = frozenset()
+                self._name_to_code = {}
+                self._market_codes = {}
                 self._collect_user_info()
             else:
                 self._is_connected = False
-                self._logger.error(f"로그인 실패: {err_code}")
+                self._logger.error("로그인 실패: %s", err_code)
         except Exception as e:
-            self._logger.error(f"로그인 이벤트 처리 오류: {e}")
+            self._logger.error("로그인 이벤트 처리 오류: %s", e)
         finally:
             if self._login_event_loop:
                 self._login_event_loop.exit()
@@ -394,21 +444,22 @@ class KiwoomComponent(QAxWidget):
         """사용자 정보 수집"""
         try:
             self._user_info = {
-                "user_name": self.dynamicCall("GetLoginInfo(QString)", "USER_NAME"),
-                "user_id": self.dynamicCall("GetLoginInfo(QString)", "USER_ID"),
-                "accounts": self.dynamicCall("GetLoginInfo(QString)", "ACCNO")
+                "user_name": self.dynamicCall(_SIG_GET_LOGIN, "USER_NAME"),
+                "user_id": self.dynamicCall(_SIG_GET_LOGIN, "USER_ID"),
+                "accounts": self.dynamicCall(_SIG_GET_LOGIN, "ACCNO")
             }
             
-            self._logger.info(f"사용자: {self._user_info['user_name']} ({self._user_info['user_id']})")
-            self._logger.info(f"계좌: {self._user_info['accounts']}")
+            self._logger.info("사용자: %s (%s)", self._user_info['user_name'], self._user_info['user_id'])
+            self._logger.info("계좌: %s", self._user_info['accounts'])
             
         except Exception as e:
-            self._logger.error(f"사용자 정보 조회 오류: {e}")
+            self._logger.error("사용자 정보 조회 오류: %s", e)
 
     async def request_tr(self, tr_code: str, inputs: Dict[str, str], 
                        callback: Optional[Callable] = None, 
                        timeout: int = 10) -> Optional[Dict[str, Any]]:
         """범용 TR 요청 메서드"""
+        screen_no: Optional[str] = None
         try:
             if not self._is_connected:
                 self._logger.error("키움 API에 로그인되지 않음")
@@ -416,58 +467,55 @@ class KiwoomComponent(QAxWidget):
             
             # 입력값 설정
             for key, value in inputs.items():
-                self.dynamicCall("SetInputValue(QString, QString)", key, value)
+                self.dynamicCall(_SIG_SET_INPUT, key, value)
             
             # 요청 생성
             self._current_request_id = self._tr_manager.create_request(tr_code, inputs, callback)
             
             # 이벤트 루프 및 타이머 설정
             self._request_event_loop = QEventLoop()
-            self._timeout_timer = QTimer()
-            self._timeout_timer.setSingleShot(True)
-            self._timeout_timer.timeout.connect(self._on_request_timeout)
             self._timeout_timer.start(timeout * 1000)
             
-            # TR 요청
-            screen_no = f"{int(time.time()) % 10000:04d}"
+            # TR 요청 (사용 중이지 않은 화면번호를 풀에서 할당)
+            screen_no = next(self._screen_pool)
+            while screen_no in self._active_screens:
+                screen_no = next(self._screen_pool)
+            self._active_screens.add(screen_no)
             ret = self.dynamicCall(
-                "CommRqData(QString, QString, int, QString)",
+                _SIG_COMM_RQ,
                 self._current_request_id,
                 tr_code,
                 "0",
                 screen_no
             )
 
-            self._logger.info(f"ret : {ret}")
+            self._logger.debug("ret : %s", ret)
             
             if ret == 0:
-                self._logger.info(f"{tr_code} 요청 성공, 응답 대기 중...")
+                self._logger.info("%s 요청 성공, 응답 대기 중...", tr_code)
                 self._request_event_loop.exec_()
                 
-                # 타이머 정리
-                if self._timeout_timer:
-                    self._timeout_timer.stop()
-                    self._timeout_timer = None
-                
                 # 결과 반환
-                request = self._tr_manager.get_request(self._current_request_id)
-                return request["result"] if request else None
+                request = self._tr_manager.pop_request(self._current_request_id)
+                return request.result if request else None
             else:
-                self._logger.error(f"{tr_code} 요청 실패: {ret}")
+                self._logger.error("%s 요청 실패: %s", tr_code, ret)
                 return None
                 
         except Exception as e:
-            self._logger.error(f"TR 요청 오류: {e}")
+            self._logger.error("TR 요청 오류: %s", e)
             return None
         finally:
+            if screen_no:
+                self._active_screens.discard(screen_no)
+            if self._current_request_id:
+                self._tr_manager.pop_request(self._current_request_id)
             self._current_request_id = None
-            if self._timeout_timer:
-                self._timeout_timer.stop()
-                self._timeout_timer = None
+            self._timeout_timer.stop()
 
     def _receive_msg(self, screen_no: str, rq_name: str, tr_code: str, msg: str) -> None:
         """주문 메시지 수신 이벤트"""
-        self._logger.info(f"주문 메시지: {msg} (화면번호: {screen_no})")
+        self._logger.info("주문 메시지: %s (화면번호: %s)", msg, screen_no)
         
         # 주문 결과를 대기 중인 주문에 연결
         for order_id, order_data in self._order_manager._pending_orders.items():
@@ -479,17 +527,17 @@ class KiwoomComponent(QAxWidget):
         """체결 데이터 수신 이벤트"""
         try:
             if gubun == "0":  # 주문체결
-                order_no = self.dynamicCall("GetChejanData(int)", 9203)
-                stock_code = self.dynamicCall("GetChejanData(int)", 9001)
-                stock_name = self.dynamicCall("GetChejanData(int)", 302)
-                order_status = self.dynamicCall("GetChejanData(int)", 913)
-                order_qty = self.dynamicCall("GetChejanData(int)", 900)
-                order_price = self.dynamicCall("GetChejanData(int)", 901)
+                order_no = self.dynamicCall(_SIG_GET_CHEJAN, 9203)
+                stock_code = self.dynamicCall(_SIG_GET_CHEJAN, 9001)
+                stock_name = self.dynamicCall(_SIG_GET_CHEJAN, 302)
+                order_status = self.dynamicCall(_SIG_GET_CHEJAN, 913)
+                order_qty = self.dynamicCall(_SIG_GET_CHEJAN, 900)
+                order_price = self.dynamicCall(_SIG_GET_CHEJAN, 901)
                 
-                self._logger.info(f"주문체결: {stock_name}({stock_code}) {order_status} {order_qty}주 {order_price}원")
+                self._logger.info("주문체결: %s(%s) %s %s주 %s원", stock_name, stock_code, order_status, order_qty, order_price)
                 
         except Exception as e:
-            self._logger.error(f"체결 데이터 처리 오류: {e}")
+            self._logger.error("체결 데이터 처리 오류: %s", e)
 
     def _on_request_timeout(self) -> None:
         """요청 타임아웃 처리"""
@@ -500,22 +548,21 @@ class KiwoomComponent(QAxWidget):
     def _receive_tr_data(self, screen_no, rq_name, tr_code, record_name, prev_next, data_len, err_code, msg1, msg2):
         """범용 TR 데이터 수신 처리"""
         try:
-            # err_code 처리
-            error_code = 0
-            if isinstance(err_code, str):
-                error_code = int(err_code) if err_code.strip() else 0
-            else:
-                error_code = int(err_code)
+            # err_code 처리 ("", None, 0, "5" 모두 한 번의 int 변환으로 처리)
+            try:
+                error_code = int(err_code or 0)
+            except (TypeError, ValueError):
+                error_code = 0
             
             if error_code != 0:
-                self._logger.error(f"TR 에러 코드: {error_code}, 메시지: {msg1}")
+                self._logger.error("TR 에러 코드: %s, 메시지: %s", error_code, msg1)
                 return
             
-            self._logger.info(f"TR 데이터 수신: {rq_name} ({tr_code})")
+            self._logger.info("TR 데이터 수신: %s (%s)", rq_name, tr_code)
             
             # 데이터 추출
             raw_data = self._extract_raw_data(tr_code, record_name)
-            self._logger.info(f"raw_data : {raw_data}")
+            self._logger.debug("raw_data : %s", raw_data)
             
             # 원시 데이터 디버깅
             # self._logger.info("원시 데이터 샘플:")
@@ -526,14 +573,11 @@ class KiwoomComponent(QAxWidget):
             # parsed_data = self._tr_manager.parse_data(tr_code, raw_data)
             
             # 요청 완료 처리
-            self._logger.info(f"현재 요청 ID: {self._current_request_id}")
-            self._logger.info(f"rq_name: {rq_name}")
+            request_id = self._current_request_id
+            self._logger.debug("현재 요청 ID: %s, rq_name: %s", request_id, rq_name)
             
-            if self._current_request_id and rq_name == self._current_request_id:
-                self._logger.info(f"현재 요청 ID: {self._current_request_id}")
-                self._logger.info(f"rq_name: {rq_name}")
-
-                self._tr_manager.complete_request(self._current_request_id, raw_data)
+            if request_id and rq_name == request_id:
+                self._tr_manager.complete_request(request_id, raw_data)
             
             # 주요 데이터만 로깅
             # if tr_code == "opt10001":
@@ -543,7 +587,7 @@ class KiwoomComponent(QAxWidget):
             #     self._logger.info(f"{stock_name}: {current_price:,}원 ({change_rate:+.2f}%)")
             
         except Exception as e:
-            self._logger.error(f"TR 데이터 처리 오류: {e}")
+            self._logger.error("TR 데이터 처리 오류: %s", e)
         finally:
             if self._request_event_loop and self._request_event_loop.isRunning():
                 self._request_event_loop.exit()
@@ -562,61 +606,87 @@ class KiwoomComponent(QAxWidget):
         # else:
         # 다른 TR의 경우 설정에서 가져오기
         config = self._tr_manager._tr_configs.get(tr_code, {})
-        self._logger.info(f"config {config}")
-        field_names = list(config.get("outputs", {}).keys())
+        self._logger.debug("config %s", config)
+        field_names = config.get("_field_tuple", ())
+        if not field_names:
+            return raw_data
         
-        nCnt = self.dynamicCall("GetRepeatCnt(QString, QString)", tr_code, "");
-        self._logger.info(f"nCnt : {nCnt}")
+        nCnt = self.dynamicCall(_SIG_GET_REPEAT_CNT, tr_code, "")
+        self._logger.debug("nCnt : %s", nCnt)
+
+        # 루프에서 반복 사용하는 값은 미리 준비
+        call = self.dynamicCall
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        tr_code = str(tr_code)
+        record_name = str(record_name) if record_name else ""
 
         for i in range(max(1, nCnt)):
+            row = {}
             for field_name in field_names:
                 try:
-                    value = self.dynamicCall(
-                        "GetCommData(QString, QString, int, QString)",
-                        str(tr_code),
-                        str(record_name) if record_name else "", 
-                        int(i), 
-                        str(field_name)
+                    value = call(
+                        _SIG_GET_COMM_DATA,
+                        tr_code,
+                        record_name, 
+                        i, 
+                        field_name
                     )
-                    self._logger.info(f"field_name : {field_name}, tr_code : {tr_code}, record_name : {record_name}")
-                    self._logger.info(f"value : {value}")
-                        # None 체크 및 문자열 정제
-                    clean_value = value.strip() if value else ""
-
-                    # 배열 형태로 데이터 구성
-                    while len(raw_data) <= i:
-                        raw_data.append({})
-
-                    raw_data[i][field_name] = clean_value
+                    if debug_enabled:
+                        self._logger.debug("field_name : %s, tr_code : %s, record_name : %s, value : %s", field_name, tr_code, record_name, value)
+                    # None 체크 및 문자열 정제
+                    row[field_name] = value.strip() if value else ""
                         
                 except Exception as e:
-                    self._logger.warning(f"{field_name} 데이터 추출 실패: {e}")
-                    raw_data[f"{field_name}_{i}"] = ""
+                    self._logger.warning("%s 데이터 추출 실패: %s", field_name, e)
+                    row[field_name] = ""
+
+            # 배열 형태로 데이터 구성
+            raw_data.append(row)
 
         return raw_data
 
     # 편의 메서드들
     async def get_stock_info(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """주식 기본정보 조회"""
-        self._logger.info(f"주식 기본정보 조회: {stock_code}")
+        self._logger.info("주식 기본정보 조회: %s", stock_code)
         return await self.request_tr("opt10001", {"종목코드": stock_code})
 
-    def get_stock_kospi(self, stock: str) -> Optional[str]:
-        """코스피 주식 코드 조회"""
+    def get_market_codes(self, market: str) -> Tuple[str, ...]:
+        """시장별 종목코드 목록 조회 (하루 단위 캐시)"""
+        key = (market, datetime.date.today())
+        codes = self._market_codes.get(key)
+        if codes is None:
+            raw = self.dynamicCall(_SIG_GET_MARKET, market) or ""
+            codes = tuple(code.strip() for code in raw.split(';') if code.strip())
+            # 빈 결과(조회 실패)는 캐시하지 않고 다음 호출에서 다시 조회
+            if codes:
+                # 지난 날짜 캐시는 버리고 오늘 목록만 유지
+                self._market_codes = {k: v for k, v in self._market_codes.items() if k[1] == key[1]}
+                self._market_codes[key] = codes
+        return codes
+
+    def load_stock_codes(self) -> None:
+        """코스피 종목코드 목록 사전 로딩 (로그인 후 1회)"""
         try:
-            kospi = self.dynamicCall("GetCodeListByMarket(QString)", "0")
-            codes = kospi.split(';')
+            codes = self.get_market_codes("0")
             
-            for code in codes:
-                code = code.strip()
-                if code:
-                    stock_name = self.dynamicCall("GetMasterCodeName(QString)", code)
-                    if stock_name == stock:
-                        return code
-            return None
+            self._code_set = frozenset(codes)
+            self._name_to_code = {
+                self.dynamicCall(_SIG_GET_NAME, code): code
+                for code in codes
+            }
+            self._logger.info("코스피 종목코드 로딩 완료: %s개", len(self._code_set))
         except Exception as e:
-            self._logger.error(f"코스피 종목 조회 오류: {e}")
-            return None
+            self._logger.error("코스피 종목코드 로딩 오류: %s", e)
+
+    def get_stock_kospi(self, stock: str) -> Optional[str]:
+        """코스피 주식 코드 조회 (종목명 -> 코드 맵 최초 1회 구성 후 재사용)"""
+        if not self._name_to_code:
+            self.load_stock_codes()
+        # 종목코드로 조회한 경우 그대로 반환
+        if stock in self._code_set:
+            return stock
+        return self._name_to_code.get(stock)
 
     async def send_order(self, screen_name: str, screen_no: str, acc_no: str, 
                         order_type: int, code: str, qty: int, price: int, 
@@ -643,7 +713,7 @@ class KiwoomComponent(QAxWidget):
             return result
             
         except Exception as e:
-            self._logger.error(f"주문 전송 오류: {e}")
+            self._logger.error("주문 전송 오류: %s", e)
             return {"success": False, "error": str(e)}
 
     @property
@@ -656,6 +726,10 @@ class KiwoomComponent(QAxWidget):
         """사용자 정보 반환"""
         return self._user_info.copy()
 
+    def supports_tr(self, tr_code: str) -> bool:
+        """TR 데이터 추출 지원 여부"""
+        return self._tr_manager.has_config(tr_code)
+
     def get_account_list(self) -> List[str]:
         """계좌 목록 반환"""
         if self._user_info.get("accounts"):
@@ -673,7 +747,7 @@ class KiwoomComponent(QAxWidget):
             elif isinstance(current_time, time.struct_time):
                 now = datetime.datetime(*current_time[0:6])  # struct_time은 튜플처럼 인덱싱 가능
             else:
-                self._logger.warning(f"예상치 못한 시간 타입: {type(current_time)}, 현재 시간 사용")
+                self._logger.warning("예상치 못한 시간 타입: %s, 현재 시간 사용", type(current_time))
                 now = datetime.datetime.now()
             
             # 주말 확인 (토요일=5, 일요일=6)
@@ -687,7 +761,7 @@ class KiwoomComponent(QAxWidget):
             return {"status": True, "message": "장 운영 중", "is_open": marketOpen <= now <= marketClose}
 
         except Exception as e:
-            self._logger.error(f"장 운영 시간 확인 오류: {e}")
+            self._logger.error("장 운영 시간 확인 오류: %s", e)
             # 오류 발생시 현재 시간 기준으로 재시도
             return self._isMarketOpen(None)
 
@@ -757,21 +831,22 @@ class KiwoomComponent(QAxWidget):
                 return self._is_market_open()
             
             # 키움 API 장 운영 상태 조회 (GetCodeListByMarket 응답으로 간접 확인)
-            kospi_codes = self.dynamicCall("GetCodeListByMarket(QString)", "0")
+            # 캐시를 거치지 않고 매번 실제로 호출해야 API 활성 여부를 확인할 수 있음
+            kospi_codes = self.dynamicCall(_SIG_GET_MARKET, "0")
             
             if kospi_codes and len(kospi_codes.split(';')) > 100:
                 # 코드 리스트가 정상적으로 조회되면 API가 활성 상태
                 time_based_status = self._is_market_open()
                 market_status = self._get_market_status()
                 
-                self._logger.info(f"장 운영 상태: {market_status['status_message']} ({market_status['current_time']})")
+                self._logger.info("장 운영 상태: %s (%s)", market_status['status_message'], market_status['current_time'])
                 return time_based_status
             else:
                 self._logger.warning("키움 API 응답 이상 - 시간 기반 판단 사용")
                 return self._is_market_open()
                 
         except Exception as e:
-            self._logger.error(f"장 운영 상태 확인 오류: {e}")
+            self._logger.error("장 운영 상태 확인 오류: %s", e)
             return self._is_market_open()
 # 싱글톤 인스턴스 생성
 kiwoom_component = KiwoomComponent()
\ No newline at end of file
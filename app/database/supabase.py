@@ -1,4 +1,4 @@
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 import os
 from dotenv import load_dotenv
 from pathlib import Path
@@ -14,7 +14,18 @@ key: str = os.getenv("SUPABASE_ANON_KEY")
 
 print(f"Connecting to Supabase at {url} with key {key}")
 
-supabase: Client = create_client(url, key)
+# HTTP 요청 타임아웃 (초)
+SUPABASE_CLIENT_TIMEOUT = 10
+
+# 클라이언트는 모듈 레벨 싱글톤으로 유지하여 내부 HTTP 커넥션 풀을 재사용
+supabase: Client = create_client(
+    url,
+    key,
+    options=ClientOptions(
+        postgrest_client_timeout=SUPABASE_CLIENT_TIMEOUT,
+        storage_client_timeout=SUPABASE_CLIENT_TIMEOUT
+    )
+)
 
 def get_supabase_client() -> Client:
     return supabase
\ No newline at end of file
@@ -9,7 +9,7 @@ from app.router import kiwoom_router as kiwoom
 from app.components.kiwoom_component import kiwoom_component
 import logging
 
-from app.utils.logging_utils import safePrint
+from app.utils.logging_utils import safePrint, shutdownLogging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,6 +26,7 @@ async def lifespan(app: FastAPI):
     yield  # 애플리케이션 실행
     
     logger.info("🛑 FastAPI 애플리케이션 종료")
+    shutdownLogging()
 
 async def autoLoginKiwoom():
     """키움 API 자동 로그인 백그라운드 태스크"""
@@ -37,6 +38,10 @@ async def autoLoginKiwoom():
         safePrint("키움 API 자동 로그인 시작")
         
         await kiwoom_component.login()
+        
+        # 종목코드 목록 사전 로딩
+        if kiwoom_component.is_connected:
+            kiwoom_component.load_stock_codes()
         logger.info("✅ 키움 API 자동 로그인 성공")
         safePrint("✅ 키움 API 자동 로그인 성공")
 
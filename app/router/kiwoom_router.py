@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from supabase import Client
 from typing import List, Optional, Dict, Any
 from app.database.supabase import get_supabase_client
@@ -8,9 +11,16 @@ from app.utils.logging_utils import setupLogging, safePrint
 logger = setupLogging()
 router = APIRouter()
 
+MAX_BULK_SYMBOLS = 20  # 일괄 조회 최대 종목 수
+BULK_TR_INTERVAL = 0.25  # 일괄 조회 시 TR 요청 간격 (초) - 키움 조회 제한(초당 약 5회) 이내 유지
+
 def get_finance_service(supabase: Client = Depends(get_supabase_client)) -> KiwoomService:
     return KiwoomService(supabase)
 
+def _normalize_symbol(symbol: str) -> str:
+    """종목 심볼 정규화 (숫자 종목코드는 대소문자가 없으므로 그대로 사용)"""
+    return symbol if symbol.isdigit() else symbol.upper()
+
 @router.get("/stock_info/{symbol}")
 async def get_stock_info(
     symbol: str, 
@@ -18,9 +28,9 @@ async def get_stock_info(
 ) -> Dict[str, Any]:
     """주식 정보 조회"""
     try:
-        logger.info(f"📊 주식 정보 조회 요청: {symbol}")
+        logger.info("📊 주식 정보 조회 요청: %s", symbol)
         
-        result = await service.get_stock_info(symbol.upper())
+        result = await service.get_stock_info(_normalize_symbol(symbol))
         
         if not result:
             raise HTTPException(
@@ -37,12 +47,51 @@ async def get_stock_info(
     except HTTPException:
         raise
     except Exception as e:
-        logger.info(f"❌ 주식 정보 조회 오류: {e}")
+        logger.info("❌ 주식 정보 조회 오류: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"주식 정보 조회 중 오류가 발생했습니다: {str(e)}"
         )
     
+@router.get("/stock_info_bulk")
+async def get_stock_info_bulk(
+    symbols: List[str] = Query(...),
+    service: KiwoomService = Depends(get_finance_service)
+) -> StreamingResponse:
+    """여러 종목 주식 정보 스트리밍 조회 (NDJSON)"""
+    logger.info("📊 주식 정보 일괄 조회 요청: %s", symbols)
+
+    # 중복 종목은 한 번만 조회
+    uniqueSymbols = list(dict.fromkeys(symbols))
+    if len(uniqueSymbols) > MAX_BULK_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 조회할 수 있는 종목은 최대 {MAX_BULK_SYMBOLS}개입니다."
+        )
+
+    async def fetchStockInfo(symbol: str) -> Dict[str, Any]:
+        """단일 종목 조회 - 오류는 해당 종목 결과로 반환"""
+        try:
+            result = await service.get_stock_info(_normalize_symbol(symbol))
+        except Exception as e:
+            logger.error("❌ 주식 정보 조회 오류 (%s): %s", symbol, e)
+            return {"symbol": symbol, "success": False, "error": str(e)}
+
+        if not result or (isinstance(result, dict) and "error" in result):
+            error = result.get("error") if result else f"주식 정보를 찾을 수 없습니다: {symbol}"
+            return {"symbol": symbol, "success": False, "error": error}
+
+        return {"symbol": symbol, "success": True, "data": result}
+
+    async def generateLines():
+        # 키움 TR은 한 번에 하나씩 처리되므로 요청 순서대로 조회하고, 조회 제한을 넘지 않도록 간격을 둠
+        for index, symbol in enumerate(uniqueSymbols):
+            if index:
+                await asyncio.sleep(BULK_TR_INTERVAL)
+            yield orjson.dumps(await fetchStockInfo(symbol)) + b"\n"
+
+    return StreamingResponse(generateLines(), media_type="application/x-ndjson")
+
 @router.post("/order")
 async def order_stock(
     symbol: str, 
@@ -53,7 +102,7 @@ async def order_stock(
 ) -> Dict[str, Any]:
     """주식 주문 처리"""
     try:
-        logger.info(f"📡 주식 주문 요청: {order_type} {quantity} {symbol} at {price}")
+        logger.info("📡 주식 주문 요청: %s %s %s at %s", order_type, quantity, symbol, price)
         
         order_result = await service.order_stock(
             symbol,
@@ -68,7 +117,7 @@ async def order_stock(
                 detail=order_result["error"]
             )
         
-        logger.info(f"✅ 주식 주문 성공: {order_result}")
+        logger.info("✅ 주식 주문 성공: %s", order_result)
         
         return {
             "success": True,
@@ -79,12 +128,76 @@ async def order_stock(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 주식 주문 오류: {e}")
+        logger.error("❌ 주식 주문 오류: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"주식 주문 중 오류가 발생했습니다: {str(e)}"
 )
 
+@router.post("/order_nowait")
+async def order_stock_nowait(
+    symbol: str, 
+    quantity: int, 
+    price: float, 
+    order_type: str,  # 'buy' or 'sell'
+    service: KiwoomService = Depends(get_finance_service)
+) -> Dict[str, Any]:
+    """주식 주문 비동기 접수 (결과는 /order_result/{correlation_id}로 조회)"""
+    logger.info("📡 주식 주문 비동기 접수 요청: %s %s %s at %s", order_type, quantity, symbol, price)
+    
+    accepted = service.order_stock_nowait(symbol, quantity, price, order_type)
+    
+    return {
+        "success": True,
+        "data": accepted,
+        "message": f"{symbol} 주식 {order_type} 주문이 비동기로 접수되었습니다."
+    }
+
+@router.get("/order_result/{correlation_id}")
+async def get_order_result(
+    correlation_id: str,
+    service: KiwoomService = Depends(get_finance_service)
+) -> Dict[str, Any]:
+    """비동기 접수 주문 결과 조회"""
+    orderResult = service.get_nowait_order_result(correlation_id)
+    
+    if "error" in orderResult:
+        raise HTTPException(
+            status_code=404,
+            detail=orderResult["error"]
+        )
+    
+    return {
+        "success": True,
+        "data": orderResult,
+        "message": f"주문 {correlation_id} 결과 조회 성공"
+    }
+
+@router.post("/bulk_order")
+async def bulk_order_stock(
+    orders: List[Dict[str, Any]] = Body(...),
+    service: KiwoomService = Depends(get_finance_service)
+) -> Dict[str, Any]:
+    """여러 주식 주문 일괄 처리 (symbol, quantity, price, orderType 목록)"""
+    try:
+        logger.info("📡 일괄 주식 주문 요청: %s건", len(orders))
+        
+        orderResults = await service.bulk_order(orders)
+        failCount = sum(1 for result in orderResults if "error" in result)
+        
+        return {
+            "success": failCount == 0,
+            "data": orderResults,
+            "message": f"일괄 주문 {len(orderResults)}건 중 {len(orderResults) - failCount}건이 접수되었습니다."
+        }
+        
+    except Exception as e:
+        logger.error("❌ 일괄 주식 주문 오류: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"일괄 주식 주문 중 오류가 발생했습니다: {str(e)}"
+        )
+
 @router.get("/pending_orders")
 async def get_pending_orders(
     service: KiwoomService = Depends(get_finance_service)
@@ -102,12 +215,75 @@ async def get_pending_orders(
         }
         
     except Exception as e:
-        logger.error(f"❌ 미체결 주문 조회 오류: {e}")
+        logger.error("❌ 미체결 주문 조회 오류: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"미체결 주문 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+    
+@router.get("/pending_orders_parsed")
+async def get_pending_orders_parsed(
+    accountNo: Optional[str] = None,
+    service: KiwoomService = Depends(get_finance_service)
+) -> Dict[str, Any]:
+    """미체결 주문 조회 (숫자 변환 및 수익률/미체결금액 포함 파싱 결과)"""
+    try:
+        logger.info("📋 미체결 주문 파싱 조회 요청")
+        
+        orders = await service.get_pending_orders(accountNo, parsed=True)
+        
+        return {
+            "success": True,
+            "data": orders,
+            "message": "미체결 주문 조회 성공"
+        }
+        
+    except Exception as e:
+        logger.error("❌ 미체결 주문 조회 오류: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"미체결 주문 조회 중 오류가 발생했습니다: {str(e)}"
         )
     
+@router.get("/pending_orders_stream")
+async def get_pending_orders_stream(
+    accountNo: Optional[str] = None,
+    service: KiwoomService = Depends(get_finance_service)
+) -> StreamingResponse:
+    """미체결 주문 스트리밍 조회 (NDJSON)"""
+    logger.info("📋 미체결 주문 스트리밍 조회 요청")
+
+    async def generateLines():
+        async for order in service.iter_pending_orders(accountNo):
+            yield orjson.dumps(order) + b"\n"
+
+    return StreamingResponse(generateLines(), media_type="application/x-ndjson")
+    
+@router.get("/account_snapshot")
+async def get_account_snapshot(
+    accountNo: Optional[str] = None,
+    days: int = 7,
+    service: KiwoomService = Depends(get_finance_service)
+) -> Dict[str, Any]:
+    """계좌 현황 조회 (미체결 주문 + 최근 체결 내역)"""
+    try:
+        logger.info("📋 계좌 현황 조회 요청")
+        
+        snapshot = await service.get_account_snapshot(accountNo, days)
+        
+        return {
+            "success": snapshot["success"],
+            "data": snapshot,
+            "message": "계좌 현황 조회 성공" if snapshot["success"] else "계좌 현황 일부 조회 실패"
+        }
+        
+    except Exception as e:
+        logger.error("❌ 계좌 현황 조회 오류: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"계좌 현황 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
 @router.post("/cancel_order")
 async def cancel_order(
     orderNo: str,
@@ -116,7 +292,7 @@ async def cancel_order(
 ) -> Dict[str, Any]:
     """주문 취소 처리"""
     try:
-        logger.info(f"🛑 주문 취소 요청: {orderNo}")
+        logger.info("🛑 주문 취소 요청: %s", orderNo)
         
         cancel_result = await service.cancel_order(orderNo, accountNo)
         
@@ -126,7 +302,7 @@ async def cancel_order(
                 detail=cancel_result["error"]
             )
         
-        logger.info(f"✅ 주문 취소 성공: {cancel_result}")
+        logger.info("✅ 주문 취소 성공: %s", cancel_result)
         
         return {
             "success": True,
@@ -137,7 +313,7 @@ async def cancel_order(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 주문 취소 오류: {e}")
+        logger.error("❌ 주문 취소 오류: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"주문 취소 중 오류가 발생했습니다: {str(e)}"
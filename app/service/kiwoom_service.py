@@ -1,21 +1,158 @@
+import asyncio
+import functools
+import sys
+import time
+import uuid
+from operator import itemgetter
+from types import MappingProxyType
 from supabase import Client
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from app.components.kiwoom_component import kiwoom_component, KiwoomComponent
 
 from app.utils.logging_utils import setupLogging
 
 from datetime import datetime, timedelta
-from datetime import datetime
 
 logger = setupLogging()
+
+QUOTE_CACHE_TTL = 2  # 주식 정보 캐시 유지 시간 (초)
+MAX_CONCURRENT_BULK_ORDERS = 8  # 일괄 주문 동시 처리 수 (키움 요청 제한 고려)
+NOWAIT_RESULT_TTL = 600  # 조회되지 않은 비동기 주문 결과 보관 시간 (초)
+
+# 숫자 데이터의 콤마/부호/공백 제거용 변환 테이블
+_NUMBER_DELETE_TABLE = str.maketrans("", "", ",+ \t\n\r")
+
+def _stripText(value: Any) -> str:
+    """문자열 앞뒤 공백 제거"""
+    return value.strip() if value else ""
+
+def _parseInteger(value: Any) -> int:
+    """키움 숫자 데이터 파싱 (콤마, + 부호 포함)"""
+    cleanValue = (value if isinstance(value, str) else str(value)).translate(_NUMBER_DELETE_TABLE)
+    if not cleanValue or cleanValue == "-":
+        return 0
+    
+    try:
+        return int(cleanValue)
+    except (ValueError, TypeError):
+        logger.warning("숫자 데이터 파싱 실패: %r", value)
+        return 0
+
+# 주문구분 코드 -> 이름 (값은 intern하여 비교 시 동일 객체 사용)
+_ORDER_TYPE_MAP = MappingProxyType({
+    code: sys.intern(name) for code, name in {
+        "1": "매수",
+        "2": "매도",
+        "+매수": "매수",
+        "-매도": "매도",
+        "매수정정": "매수정정",
+        "매도정정": "매도정정",
+        "매수취소": "매수취소",
+        "매도취소": "매도취소"
+    }.items()
+})
+
+def _getOrderTypeName(orderType: str) -> str:
+    """주문구분 코드를 이름으로 변환"""
+    return _ORDER_TYPE_MAP.get(orderType.strip(), orderType)
+
+# 미체결 주문 필드별 파서 (opt10075) - 필드명은 intern하여 TR 데이터 키와 동일 객체로 조회
+_PENDING_SPEC = tuple((sys.intern(key), parse) for key, parse in (
+    ("계좌번호", _stripText),
+    ("주문번호", _stripText),
+    ("종목코드", _stripText),
+    ("종목명", _stripText),
+    ("주문상태", _stripText),
+    ("주문구분", _getOrderTypeName),
+    ("매매구분", _stripText),
+    ("업무구분", _stripText),
+    ("주문가격", _parseInteger),
+    ("주문수량", _parseInteger),
+    ("미체결수량", _parseInteger),
+    ("체결가", _parseInteger),
+    ("체결량", _parseInteger),
+    ("현재가", _parseInteger),
+    ("단위체결가", _parseInteger),
+    ("단위체결량", _parseInteger),
+    ("시간", _stripText)
+))
+
+def _parsePendingOrder(row: Dict[str, Any]) -> Dict[str, Any]:
+    """미체결 주문 한 건 파싱 (수익률, 미체결금액 포함)"""
+    order = {key: parse(row.get(key, "")) for key, parse in _PENDING_SPEC}
+    
+    # 파생 필드 계산 - 필요한 값은 지역 변수로 한 번만 조회
+    price = order["주문가격"]
+    currentPrice = abs(order["현재가"])  # 키움 현재가는 등락 부호 포함
+    quantity = order["미체결수량"]
+    
+    if not (price and currentPrice):
+        profitRate = 0.0
+    elif order["주문구분"] == "매수":
+        profitRate = round((currentPrice - price) / price * 100, 2)
+    else:
+        profitRate = round((price - currentPrice) / currentPrice * 100, 2)
+    
+    order["수익률"] = profitRate
+    order["미체결금액"] = quantity * price
+    return order
+
+# 체결 내역 필드별 파서 (opt10076) - 필드명은 intern하여 TR 데이터 키와 동일 객체로 조회
+_ORDER_HISTORY_SPEC = tuple((sys.intern(key), parse) for key, parse in (
+    ("체결번호", _stripText),
+    ("주문번호", _stripText),
+    ("종목코드", _stripText),
+    ("종목명", _stripText),
+    ("주문구분", _getOrderTypeName),
+    ("체결수량", _parseInteger),
+    ("체결가격", _parseInteger),
+    ("체결금액", _parseInteger),
+    ("체결시간", _stripText),
+    ("체결일자", _stripText),
+    ("수수료", _parseInteger),
+    ("세금", _parseInteger)
+))
+
+@functools.lru_cache(maxsize=8)
+def _getDateRange(secondBucket: int, days: int) -> Tuple[str, str]:
+    """최근 N일 조회 기간 (YYYYMMDD) - 초 단위로 캐싱"""
+    now = datetime.now()
+    return (now - timedelta(days=days)).strftime("%Y%m%d"), now.strftime("%Y%m%d")
+
 class KiwoomService:
+    # 인스턴스 속성 고정 (공유 상태는 아래 클래스 속성으로 관리)
+    __slots__ = ("supabase", "_kiwoom", "_logger")
+
+    # 진행 중인 종목 조회 태스크 (서비스는 요청마다 생성되므로 클래스 레벨에서 공유)
+    _inflight: Dict[str, asyncio.Task] = {}
+    # 주식 정보 캐시 (종목 -> (조회 시각, 결과))
+    _quote_cache: Dict[str, Tuple[float, Any]] = {}
+    # 비동기 접수 주문 (correlation_id -> 주문 태스크 / (완료 시각, 완료 결과))
+    _nowait_orders: Dict[str, asyncio.Task] = {}
+    _nowait_results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
     def __init__(self, supabase: Client):
         self.supabase = supabase
         self._kiwoom: KiwoomComponent = kiwoom_component
         self._logger = logger
 
     async def get_stock_info(self, symbol) -> List[Dict[str, Any]]:
-        """주식 데이터 조회"""
+        """주식 데이터 조회 - 짧은 TTL 캐시 후 같은 종목의 동시 요청은 하나의 조회로 합침"""
+        cached = KiwoomService._quote_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < QUOTE_CACHE_TTL:
+            return cached[1]
+        
+        task = KiwoomService._inflight.get(symbol)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_stock_info(symbol))
+            KiwoomService._inflight[symbol] = task
+            task.add_done_callback(lambda _: KiwoomService._inflight.pop(symbol, None))
+        
+        # 한 호출자의 취소가 다른 대기자에게 전파되지 않도록 보호
+        return await asyncio.shield(task)
+
+    async def _fetch_stock_info(self, symbol) -> List[Dict[str, Any]]:
+        """주식 데이터 실제 조회"""
         if not self._kiwoom.is_connected:
             return {"error": "키움증권 API에 연결되지 않았습니다. 먼저 로그인을 해주세요."}
         
@@ -24,6 +161,8 @@ class KiwoomService:
             return {"error": f"종목 '{symbol}'을 찾을 수 없습니다."}
         
         stock_info = await self._kiwoom.get_stock_info(stockCode)
+        if stock_info:
+            KiwoomService._quote_cache[symbol] = (time.monotonic(), stock_info)
         return stock_info
     
     async def order_stock(self, symbol: str, quantity: int, price: int, orderType: str) -> Dict[str, Any]:
@@ -33,51 +172,54 @@ class KiwoomService:
             if not self._kiwoom.is_connected:
                 return {"error": "키움증권 API에 연결되지 않았습니다. 먼저 로그인을 해주세요."}
             
-            # 종목코드 조회
+            # 종목코드 조회, 계좌 정보, 거래시간 확인
+            # (키움 OCX는 생성한 Qt 스레드에서만 호출해야 하므로 이벤트 루프 스레드에서 직접 호출)
             stockCode = self._kiwoom.get_stock_kospi(symbol)
+            accountList = self._kiwoom.get_account_list()
+            is_market_open = self._kiwoom._is_market_open(datetime.now())
+            
             if not stockCode:
                 return {"error": f"종목 '{symbol}'을 찾을 수 없습니다."}
             
-            # 계좌 정보 확인
-            accountList = self._kiwoom.get_account_list()
             if not accountList:
                 return {"error": "사용 가능한 계좌가 없습니다."}
             
             primaryAccount = accountList[0]
-            self._logger.info(f"주문 계좌: {primaryAccount}")
+            self._logger.info("주문 계좌: %s", primaryAccount)
+            
+            if orderType not in ('buy', 'sell'):
+                return {"error": "orderType은 'buy' 또는 'sell'이어야 합니다."}
+            
+            # 거래시간에 따른 호가구분 결정 (매수/매도 공통)
+            if is_market_open.get("status") and is_market_open.get("is_open"):
+                # 장중 거래 - 지정가 주문
+                hoga_gb = "00"  # 지정가
+                is_regular_session = True
+            elif is_market_open.get("status") and not is_market_open.get("is_open"):
+                # 장외 거래 - 시간외 단일가 주문
+                hoga_gb = "61"  # 시간외단일가
+                is_regular_session = False
+            else:
+                return {"error": "현재는 거래 시간이 아닙니다. 거래 시간 내에 주문해 주세요."}
+            
+            self._logger.info("거래시간 구분: %s, 호가구분: %s", '장중' if is_regular_session else '장외', hoga_gb)
             
-            # 주문 실행 (동기 메서드이므로 await 제거)
+            # 주문 실행
             if orderType == 'buy':
-                # 거래시간 확인
-                current_time = datetime.now()
-                is_market_open = self._kiwoom._is_market_open(current_time)
-
-                if is_market_open.get("status") and is_market_open.get("is_open"):
-                    # 장중 거래 - 지정가 주문
-                    hoga_gb = "00"  # 지정가
-                    screen_name = "주식매수"
-                elif is_market_open.get("status") and not is_market_open.get("is_open"):
-                    # 장외 거래 - 시간외 단일가 주문
-                    hoga_gb = "61"  # 시간외단일가
-                    screen_name = "시간외매수"
-                else:
-                    return {"error": "현재는 거래 시간이 아닙니다. 거래 시간 내에 주문해 주세요."}
-
-                self._logger.info(f"거래시간 구분: {'장중' if is_market_open else '장외'}, 호가구분: {hoga_gb}")
                 result = await self._kiwoom.send_order(
-                    screen_name=screen_name,
+                    screen_name="주식매수" if is_regular_session else "시간외매수",
                     screen_no="0101",
                     acc_no=primaryAccount,
                     order_type=1,  # 신규매수
                     code=stockCode,
                     qty=quantity,
                     price=price,
-                    hoga_gb=hoga_gb,  # 지정가
+                    hoga_gb=hoga_gb,
                     org_order_no=""
                 )
-            elif orderType == 'sell':
+            else:
                 result = await self._kiwoom.send_order(
-                    screen_name="주식매도",
+                    screen_name="주식매도" if is_regular_session else "시간외매도",
                     screen_no="0102", 
                     acc_no=primaryAccount,
                     order_type=2,  # 신규매도
@@ -87,8 +229,6 @@ class KiwoomService:
                     hoga_gb=hoga_gb,
                     org_order_no=""
                 )
-            else:
-                return {"error": "orderType은 'buy' 또는 'sell'이어야 합니다."}
             
             # 결과 처리
             if result.get("return_code") == 0:
@@ -107,48 +247,98 @@ class KiwoomService:
                 }
         
         except TypeError as e:
-            self._logger.error(f"메서드 호출 오류: {e}")
+            self._logger.error("메서드 호출 오류: %s", e)
             return {"error": f"메서드 호출 중 오류가 발생했습니다: {str(e)}"}
         except AttributeError as e:
-            self._logger.error(f"속성 접근 오류: {e}")
+            self._logger.error("속성 접근 오류: %s", e)
             return {"error": f"키움 API 메서드 접근 중 오류가 발생했습니다: {str(e)}"}
         except Exception as e:
-            self._logger.error(f"주식 주문 오류: {e}")
+            self._logger.error("주식 주문 오류: %s", e)
             return {"error": f"주식 주문 중 오류가 발생했습니다: {str(e)}"}
 
-    async def get_pending_orders(self, accountNo: Optional[str] = None) -> Dict[str, Any]:
-        """진행중인 주문 내역 조회"""
+    def order_stock_nowait(self, symbol: str, quantity: int, price: int, orderType: str) -> Dict[str, Any]:
+        """주식 주문 비동기 접수 - 주문 결과를 기다리지 않고 correlation_id 반환"""
+        self._evict_nowait_results()
+        correlationId = f"NOWAIT_{uuid.uuid4().hex[:8]}"
+        
+        task = asyncio.ensure_future(self.order_stock(symbol, quantity, price, orderType))
+        KiwoomService._nowait_orders[correlationId] = task
+        task.add_done_callback(lambda done: self._complete_nowait_order(correlationId, done))
+        
+        self._logger.info("주문 비동기 접수: %s (%s %s %s at %s)", correlationId, orderType, quantity, symbol, price)
+        return {"correlation_id": correlationId, "accepted": True}
+
+    def get_nowait_order_result(self, correlationId: str) -> Dict[str, Any]:
+        """비동기 접수 주문 결과 조회 (완료된 결과는 조회 후 삭제)"""
+        if correlationId in KiwoomService._nowait_orders:
+            return {"correlation_id": correlationId, "status": "pending"}
+        
+        self._evict_nowait_results()
+        entry = KiwoomService._nowait_results.pop(correlationId, None)
+        if entry is None:
+            return {"error": f"주문 정보를 찾을 수 없습니다: {correlationId}"}
+        
+        return {"correlation_id": correlationId, "status": "completed", "result": entry[1]}
+
+    @staticmethod
+    def _evict_nowait_results() -> None:
+        """보관 시간이 지난 비동기 주문 결과 삭제 (조회되지 않은 결과가 쌓이지 않도록)"""
+        results = KiwoomService._nowait_results
+        if not results:
+            return
+        
+        expireBefore = time.monotonic() - NOWAIT_RESULT_TTL
+        for correlationId in [key for key, (completedAt, _) in results.items() if completedAt < expireBefore]:
+            del results[correlationId]
+
+    def _complete_nowait_order(self, correlationId: str, task: asyncio.Task) -> None:
+        """비동기 접수 주문 완료 처리"""
+        KiwoomService._nowait_orders.pop(correlationId, None)
+        
+        if task.cancelled():
+            result = {"error": "주문이 취소되었습니다."}
+        elif task.exception():
+            result = {"error": f"주식 주문 중 오류가 발생했습니다: {str(task.exception())}"}
+        else:
+            result = task.result()
+        
+        KiwoomService._nowait_results[correlationId] = (time.monotonic(), result)
+        self._logger.info("비동기 주문 완료: %s %s", correlationId, result)
+
+    async def bulk_order(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 주식 주문 동시 처리 (동시 처리 수 제한)"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BULK_ORDERS)
+        
+        async def orderOne(order: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.order_stock(
+                    order["symbol"],
+                    order["quantity"],
+                    order["price"],
+                    order["orderType"]
+                )
+        
+        results = await asyncio.gather(
+            *(orderOne(order) for order in orders),
+            return_exceptions=True
+        )
+        
+        orderResults = []
+        for order, result in zip(orders, results):
+            if isinstance(result, Exception):
+                self._logger.error("일괄 주문 오류 (%s): %s", order, result)
+                result = {"error": f"주식 주문 중 오류가 발생했습니다: {str(result)}"}
+            orderResults.append(result)
+        return orderResults
+
+    async def get_pending_orders(self, accountNo: Optional[str] = None, parsed: bool = False) -> Dict[str, Any]:
+        """진행중인 주문 내역 조회 (parsed=True이면 숫자 변환/파생 필드가 포함된 파싱 결과 반환)"""
         try:
-            # 연결 상태 확인
-            if not self._kiwoom.is_connected:
-                return {"error": "키움증권 API에 연결되지 않았습니다. 먼저 로그인을 해주세요."}
+            response = await self._request_pending_orders(accountNo)
+            if "error" in response:
+                return response
             
-            # 계좌 정보 확인
-            accountList = self._kiwoom.get_account_list()
-            if not accountList:
-                return {"error": "사용 가능한 계좌가 없습니다."}
-            
-            # 계좌번호 설정 (미지정시 첫 번째 계좌 사용)
-            targetAccount = accountNo if accountNo else accountList[0]
-            if targetAccount not in accountList:
-                return {"error": f"유효하지 않은 계좌번호입니다: {targetAccount}"}
-            
-            self._logger.info(f"미체결 주문 조회 계좌: {targetAccount}")
-            
-            # opt10075 TR 요청 (실시간 미체결 요청)
-            trInputs = {
-                "계좌번호": targetAccount,
-                "종목구분": "0",
-                "매매구분": "0",   # 0: 전체, 1: 매도, 2: 매수
-                "종목코드" : "",
-                "체결구분": "1",  # 0: 전체, 1: 미체결, 2: 체결
-                "거래소구분": "0"
-            }
-            
-            rawData = await self._kiwoom.request_tr("opt10075", trInputs)
-            
-            self._logger.info(f"미체결 주문 rawData: {rawData}")
-
+            rawData = response["rawData"]
             if not rawData:
                 return {
                     "success": True,
@@ -157,18 +347,88 @@ class KiwoomService:
                     "totalCount": 0
                 }
             
+            # 기본 응답은 TR 원본 행 그대로 유지, 파싱 결과는 요청한 경우에만 생성
+            pendingOrders = self._parse_pending_orders(rawData) if parsed else rawData
+            
             return {
                 "success": True,
-                "message": f"미체결 주문 {len(rawData)}건을 조회했습니다.",
-                "orders": rawData,
-                "totalCount": len(rawData),
-                "accountNo": targetAccount
+                "message": f"미체결 주문 {len(pendingOrders)}건을 조회했습니다.",
+                "orders": pendingOrders,
+                "totalCount": len(pendingOrders),
+                "accountNo": response["accountNo"]
             }
             
         except Exception as e:
-            self._logger.error(f"미체결 주문 조회 오류: {e}")
+            self._logger.error("미체결 주문 조회 오류: %s", e)
             return {"error": f"미체결 주문 조회 중 오류가 발생했습니다: {str(e)}"}
     
+    async def iter_pending_orders(self, accountNo: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """진행중인 주문 내역 스트리밍 조회 (파싱된 주문을 한 건씩 반환)"""
+        try:
+            response = await self._request_pending_orders(accountNo)
+        except Exception as e:
+            self._logger.error("미체결 주문 조회 오류: %s", e)
+            response = {"error": f"미체결 주문 조회 중 오류가 발생했습니다: {str(e)}"}
+        
+        if "error" in response:
+            yield response
+            return
+        
+        try:
+            async for order in self._iter_pending_orders(response["rawData"]):
+                yield order
+        except Exception as e:
+            self._logger.error("미체결 주문 파싱 오류: %s", e)
+            yield {"error": f"미체결 주문 파싱 중 오류가 발생했습니다: {str(e)}"}
+    
+    async def _request_pending_orders(self, accountNo: Optional[str] = None) -> Dict[str, Any]:
+        """미체결 주문 TR 요청 (opt10075)"""
+        # 연결 상태 확인
+        if not self._kiwoom.is_connected:
+            return {"error": "키움증권 API에 연결되지 않았습니다. 먼저 로그인을 해주세요."}
+        
+        # 계좌 정보 확인
+        accountList = self._kiwoom.get_account_list()
+        if not accountList:
+            return {"error": "사용 가능한 계좌가 없습니다."}
+        
+        # 계좌번호 설정 (미지정시 첫 번째 계좌 사용)
+        targetAccount = accountNo if accountNo else accountList[0]
+        if targetAccount not in accountList:
+            return {"error": f"유효하지 않은 계좌번호입니다: {targetAccount}"}
+        
+        self._logger.info("미체결 주문 조회 계좌: %s", targetAccount)
+        
+        # opt10075 TR 요청 (실시간 미체결 요청)
+        trInputs = {
+            "계좌번호": targetAccount,
+            "종목구분": "0",
+            "매매구분": "0",   # 0: 전체, 1: 매도, 2: 매수
+            "종목코드" : "",
+            "체결구분": "1",  # 0: 전체, 1: 미체결, 2: 체결
+            "거래소구분": "0"
+        }
+        
+        rawData = await self._kiwoom.request_tr("opt10075", trInputs)
+        
+        self._logger.info("미체결 주문 rawData: %s", rawData)
+        
+        return {"accountNo": targetAccount, "rawData": rawData}
+    
+    async def get_account_snapshot(self, accountNo: Optional[str] = None, days: int = 7) -> Dict[str, Any]:
+        """계좌 현황 조회 (미체결 주문 + 최근 체결 내역 동시 조회)"""
+        pendingOrders, orderHistory = await asyncio.gather(
+            self.get_pending_orders(accountNo),
+            self.getOrderHistory(accountNo, days)
+        )
+        
+        # 체결 내역 오류(미지원 포함)는 orderHistory에 담고, 성공 여부는 미체결 주문 기준
+        return {
+            "success": "error" not in pendingOrders,
+            "pendingOrders": pendingOrders,
+            "orderHistory": orderHistory
+        }
+    
     async def cancel_order(self, orderNo: str, accountNo: Optional[str] = None) -> Dict[str, Any]:
         """주문 취소"""
         try:
@@ -209,7 +469,7 @@ class KiwoomService:
                 }
                 
         except Exception as e:
-            self._logger.error(f"주문 취소 오류: {e}")
+            self._logger.error("주문 취소 오류: %s", e)
             return {"error": f"주문 취소 중 오류가 발생했습니다: {str(e)}"}
     
     async def getOrderHistory(self, accountNo: Optional[str] = None, days: int = 7) -> Dict[str, Any]:
@@ -219,16 +479,19 @@ class KiwoomService:
             if not self._kiwoom.is_connected:
                 return {"error": "키움증권 API에 연결되지 않았습니다."}
             
+            # opt10076 출력 필드 설정이 없으면 빈 결과를 '체결 내역 없음'으로 오인하지 않도록 미지원 처리
+            if not self._kiwoom.supports_tr("opt10076"):
+                return {"error": "체결 내역 조회(opt10076)는 아직 지원되지 않습니다.", "available": False}
+            
             # 계좌 정보 확인  
-            accountList = self._kiwoom.getAccountList()
+            accountList = self._kiwoom.get_account_list()
             if not accountList:
                 return {"error": "사용 가능한 계좌가 없습니다."}
             
             targetAccount = accountNo if accountNo else accountList[0]
             
             # 날짜 계산 (YYYYMMDD 형식)
-            endDate = datetime.now().strftime("%Y%m%d")
-            startDate = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+            startDate, endDate = _getDateRange(int(time.time()), days)
             
             # opt10076 TR 요청 (계좌별 체결내역)
             trInputs = {
@@ -238,7 +501,7 @@ class KiwoomService:
                 "매매구분": "0"  # 0: 전체, 1: 매도, 2: 매수
             }
             
-            rawData = await self._kiwoom.requestTr("opt10076", trInputs)
+            rawData = await self._kiwoom.request_tr("opt10076", trInputs)
             
             if not rawData:
                 return {
@@ -261,46 +524,53 @@ class KiwoomService:
             }
             
         except Exception as e:
-            self._logger.error(f"주문 체결 내역 조회 오류: {e}")
+            self._logger.error("주문 체결 내역 조회 오류: %s", e)
             return {"error": f"주문 체결 내역 조회 중 오류가 발생했습니다: {str(e)}"}
     
+    def _parse_pending_orders(self, rawData: Any) -> List[Dict[str, Any]]:
+        """미체결 주문 데이터 파싱"""
+        if not rawData:
+            return []
+        
+        if isinstance(rawData, dict):
+            return [_parsePendingOrder(rawData)]
+        
+        orders = [_parsePendingOrder(row) for row in rawData if row]
+        
+        # 주문시간 기준 내림차순 정렬 (2건 이상일 때만)
+        if len(orders) > 1:
+            orders.sort(key=itemgetter("시간"), reverse=True)
+        
+        return orders
+
+    async def _iter_pending_orders(self, rawData: Any) -> AsyncIterator[Dict[str, Any]]:
+        """미체결 주문 데이터를 한 건씩 파싱 (TR 수신 순서 유지)"""
+        if not rawData:
+            return
+        
+        if isinstance(rawData, dict):
+            rawData = [rawData]
+        
+        for row in rawData:
+            if row:
+                yield _parsePendingOrder(row)
+
     def _parseOrderHistory(self, rawData: Dict[str, Any]) -> List[Dict[str, Any]]:
         """주문 체결 내역 데이터 파싱"""
-        try:
-            orders = []
-            
-            if isinstance(rawData, dict):
-                rawData = [rawData]
-            
-            for orderData in rawData:
-                if not orderData:
-                    continue
-                
-                order = {
-                    "체결번호": orderData.get("체결번호", ""),
-                    "주문번호": orderData.get("주문번호", ""),
-                    "종목코드": orderData.get("종목코드", "").strip(),
-                    "종목명": orderData.get("종목명", "").strip(),
-                    "주문구분": self._getOrderTypeName(orderData.get("주문구분", "")),
-                    "체결수량": self._parseInteger(orderData.get("체결수량", "0")),
-                    "체결가격": self._parseInteger(orderData.get("체결가격", "0")),
-                    "체결금액": self._parseInteger(orderData.get("체결금액", "0")),
-                    "체결시간": orderData.get("체결시간", "").strip(),
-                    "체결일자": orderData.get("체결일자", "").strip(),
-                    "수수료": self._parseInteger(orderData.get("수수료", "0")),
-                    "세금": self._parseInteger(orderData.get("세금", "0"))
-                }
-                
-                # 실제 수익 계산 (수수료, 세금 포함)
-                order["실수익"] = order["체결금액"] - order["수수료"] - order["세금"]
-                
-                orders.append(order)
-            
-            # 체결시간 기준 내림차순 정렬
-            orders.sort(key=lambda x: f"{x['체결일자']} {x['체결시간']}", reverse=True)
-            
-            return orders
-            
-        except Exception as e:
-            self._logger.error(f"주문 체결 내역 파싱 오류: {e}")
-            return []
\ No newline at end of file
+        if not rawData:
+            return []
+        
+        if isinstance(rawData, dict):
+            rawData = [rawData]
+        
+        orders = [{key: parse(row.get(key, "")) for key, parse in _ORDER_HISTORY_SPEC} for row in rawData if row]
+        
+        # 실제 수익 계산 (수수료, 세금 포함)
+        for order in orders:
+            order["실수익"] = order["체결금액"] - order["수수료"] - order["세금"]
+        
+        # 체결시간 기준 내림차순 정렬 (2건 이상일 때만)
+        if len(orders) > 1:
+            orders.sort(key=itemgetter("체결일자", "체결시간"), reverse=True)
+        
+        return orders
@@ -1,8 +1,24 @@
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from typing import Any
+from typing import Any, Dict
 from pathlib import Path
 
+# 이모지 -> 텍스트 변환 테이블 (모듈 로드 시 한 번만 생성)
+_EMOJI_TABLE = str.maketrans({
+    '📊': '[INFO]',
+    '❌': '[ERROR]',
+    '✅': '[SUCCESS]',
+    '⏳': '[WAIT]',
+    '🔐': '[LOGIN]',
+    '💰': '[PRICE]',
+    '💳': '[ACCOUNT]',
+    '📡': '[REQUEST]',
+    '🎉': '[COMPLETE]'
+})
+
 class SafeFormatter(logging.Formatter):
     """이모지 안전 처리 로그 포매터"""
     
@@ -13,50 +29,71 @@ class SafeFormatter(logging.Formatter):
             return message
         except UnicodeEncodeError:
             # 이모지를 텍스트로 변환
-            emojiMap = {
-                '📊': '[INFO]',
-                '❌': '[ERROR]', 
-                '✅': '[SUCCESS]',
-                '⏳': '[WAIT]',
-                '🔐': '[LOGIN]',
-                '💰': '[PRICE]',
-                '💳': '[ACCOUNT]',
-                '📡': '[REQUEST]',
-                '🎉': '[COMPLETE]'
-            }
-            
-            message = super().format(record)
-            for emoji, text in emojiMap.items():
-                message = message.replace(emoji, text)
-            
-            return message
+            return super().format(record).translate(_EMOJI_TABLE)
+
+# 콘솔 UTF-8 설정 완료 여부
+_consoleConfigured = False
+
+def ensureUtf8Console() -> None:
+    """표준 출력/에러를 UTF-8로 재설정 (프로세스당 한 번만 수행)"""
+    global _consoleConfigured
+    if _consoleConfigured:
+        return
+    _consoleConfigured = True
+    
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(encoding='utf-8', errors='backslashreplace')
+        except AttributeError:
+            pass
+    
+    # Windows 콘솔 코드페이지를 UTF-8로 변경 (chcp 65001 셸 호출 대신)
+    if os.name == 'nt':
+        import ctypes
+        ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+
+# 구성 완료된 로거 (로그 파일 경로 -> 로거)
+_configuredLoggers: Dict[Path, logging.Logger] = {}
+# 파일/콘솔 출력을 담당하는 백그라운드 리스너 (로그 파일 경로 -> 리스너)
+_queueListeners: Dict[Path, logging.handlers.QueueListener] = {}
 
 def setupLogging() -> logging.Logger:
-    """로깅 시스템 초기화"""
+    """로깅 시스템 초기화 (로그 파일 경로별로 한 번만 구성)"""
+    logFile = Path('logs') / 'app.log'
+    if logFile in _configuredLoggers:
+        return _configuredLoggers[logFile]
+    
     logger = logging.getLogger('kiwoom_app')
-    logger.setLevel(logging.INFO)
+    # 로그 레벨은 LOG_LEVEL 환경 변수로 조정 (기본 INFO)
+    logLevel = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+    if not isinstance(logLevel, int):
+        logLevel = logging.INFO
+    logger.setLevel(logLevel)
     logger.propagate = False
 
     
     # 기존 핸들러 제거
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+        handler.close()
     
     # 로그 디렉토리 생성
-    logDir = Path('logs')
-    logDir.mkdir(exist_ok=True)
+    logFile.parent.mkdir(exist_ok=True)
     
     # 파일 핸들러 (UTF-8 인코딩)
     fileHandler = logging.FileHandler(
-        logDir / 'app.log', 
+        logFile, 
         mode='a', 
         encoding='utf-8'
     )
-    fileHandler.setLevel(logging.INFO)
+    fileHandler.setLevel(logLevel)
+    
+    # 콘솔 출력을 UTF-8로 재설정 (cp949 콘솔에서도 인코딩 오류가 나지 않도록)
+    ensureUtf8Console()
     
     # 콘솔 핸들러
     consoleHandler = logging.StreamHandler(sys.stdout)
-    consoleHandler.setLevel(logging.INFO)
+    consoleHandler.setLevel(logLevel)
     
     # 안전한 포매터 적용
     formatter = SafeFormatter(
@@ -67,11 +104,40 @@ def setupLogging() -> logging.Logger:
     fileHandler.setFormatter(formatter)
     consoleHandler.setFormatter(formatter)
     
-    logger.addHandler(fileHandler)
-    logger.addHandler(consoleHandler)
+    # 로거에는 큐 핸들러만 붙이고 실제 파일/콘솔 I/O는 리스너 스레드에서 처리
+    # (Qt 이벤트 스레드의 로그 호출이 디스크/콘솔 쓰기로 막히지 않도록)
+    logQueue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(logQueue))
     
+    listener = logging.handlers.QueueListener(
+        logQueue,
+        fileHandler,
+        consoleHandler,
+        respect_handler_level=True
+    )
+    listener.start()
+    
+    _queueListeners[logFile] = listener
+    _configuredLoggers[logFile] = logger
     return logger
 
+def shutdownLogging() -> None:
+    """백그라운드 로그 리스너 종료 (남은 로그를 모두 기록한 뒤 실제 핸들러를 로거에 직접 연결)"""
+    for logFile, listener in list(_queueListeners.items()):
+        listener.stop()
+        del _queueListeners[logFile]
+        
+        # 종료 이후 로그가 소비되지 않는 큐에 쌓여 유실되지 않도록 큐 핸들러를 제거하고
+        # 파일/콘솔 핸들러로 직접 기록 (핸들러 종료는 인터프리터 종료 시 logging.shutdown이 처리)
+        logger = _configuredLoggers.get(logFile)
+        if logger is None:
+            continue
+        for handler in logger.handlers[:]:
+            if isinstance(handler, logging.handlers.QueueHandler):
+                logger.removeHandler(handler)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+
 def safePrint(*args: Any, **kwargs: Any) -> None:
     """안전한 콘솔 출력"""
     try:
@@ -81,16 +147,7 @@ def safePrint(*args: Any, **kwargs: Any) -> None:
         convertedArgs = []
         for arg in args:
             if isinstance(arg, str):
-                converted = (arg.replace('📊', '[INFO]')
-                           .replace('❌', '[ERROR]')
-                           .replace('✅', '[SUCCESS]')
-                           .replace('⏳', '[WAIT]')
-                           .replace('🔐', '[LOGIN]')
-                           .replace('💰', '[PRICE]')
-                           .replace('💳', '[ACCOUNT]')
-                           .replace('📡', '[REQUEST]')
-                           .replace('🎉', '[COMPLETE]'))
-                convertedArgs.append(converted)
+                convertedArgs.append(arg.translate(_EMOJI_TABLE))
             else:
                 convertedArgs.append(arg)
         print(*convertedArgs, **kwargs)
\ No newline at end of file